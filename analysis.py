@@ -1,7 +1,13 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import re
 import networkx as nx
+from itertools import chain, combinations
+
+
+# Collaboration markers collapsed into the "&" separator
+_ARTIST_SEPARATOR_PATTERN = re.compile(r"feat\.|ft\.|and")
 
 
 # ======================================================
@@ -13,15 +19,34 @@ def load_data(file_path):
     Loads UK Top 50 dataset and performs basic validation
     """
 
-    df = pd.read_csv(file_path)
+    # Load only the columns used downstream
+    df = pd.read_csv(
+        file_path,
+        usecols=[
+            "date", "position", "song", "artist", "is_explicit",
+            "album_type", "duration_ms", "total_tracks", "popularity"
+        ],
+        parse_dates=["date"],
+        date_format="%d-%m-%Y",
+        engine="pyarrow"
+    )
 
     # Remove duplicates and missing critical values
     df = df.drop_duplicates()
     df = df.dropna(subset=["date", "position", "song", "artist"])
 
-    # Correct data types
-    df["position"] = df["position"].astype(int)
-    df["date"] = pd.to_datetime(df["date"])
+    # Correct data types (nullable where values may still be missing);
+    # applied after cleaning since a read_csv dtype map would also cast
+    # incomplete integer columns under the pyarrow engine
+    df = df.astype({
+        "position": "int32",
+        "song": "category",
+        "album_type": "category",
+        "is_explicit": "boolean",
+        "duration_ms": "Int32",
+        "total_tracks": "Int16",
+        "popularity": "Int16"
+    })
 
     return df
 
@@ -35,14 +60,19 @@ def normalize_artist_names(df):
     Standardizes artist names and prepares collaboration lists
     """
 
-    def clean_artist_name(name):
-        name = name.lower()
-        name = re.sub(r"feat\.|ft\.|and", "&", name)
-        name = name.replace(" ", "")
-        return name
+    artist_clean = (
+        df["artist"]
+        .str.lower()
+        .str.replace(_ARTIST_SEPARATOR_PATTERN, "&", regex=True)
+        .str.replace(" ", "", regex=False)
+    )
+
+    # Arrow list column: no per-row Python list objects, columnar explode
+    artist_list_dtype = pd.ArrowDtype(pa.list_(pa.string()))
 
-    df["artist_clean"] = df["artist"].apply(clean_artist_name)
-    df["artist_list"] = df["artist_clean"].str.split("&")
+    df["artist_clean"] = artist_clean.astype("category")
+    df["artist_list"] = artist_clean.str.split("&").astype(artist_list_dtype)
+    df["is_collab"] = df["artist"].str.contains("&", regex=False)
 
     return df
 
@@ -69,29 +99,40 @@ def calculate_market_kpis(track_df, artist_df):
 
     total_tracks = len(track_df)
 
-    # Artist dominance
-    artist_frequency = artist_df["artist_list"].value_counts()
-    artist_share = artist_frequency / total_tracks
+    # Artist dominance (integer artist codes, counted with bincount)
+    codes, artists = pd.factorize(artist_df["artist_list"])
+    counts = np.bincount(codes[codes >= 0], minlength=len(artists))
+    order = np.argsort(-counts, kind="stable")
+
+    artist_frequency = pd.Series(
+        counts[order],
+        index=artists[order].rename("artist_list"),
+        name="count"
+    )
+
+    counts = counts[order].astype(np.float64)
 
-    artist_concentration_index = (artist_share ** 2).sum()
-    top5_artist_share = artist_share.head(5).sum()
+    artist_concentration_index = np.square(counts).sum() / total_tracks ** 2
+    top5_artist_share = counts[:5].sum() / total_tracks
 
     # Diversity metrics
-    unique_artist_count = artist_df["artist_list"].nunique()
+    unique_artist_count = len(artists)
     diversity_score = unique_artist_count / total_tracks
 
     # Collaboration metrics
-    track_df["is_collaboration"] = track_df["artist"].str.contains("&")
-    collaboration_ratio = track_df["is_collaboration"].mean()
+    collaboration_ratio = track_df["is_collab"].mean()
 
     # Explicit content metrics
     explicit_content_share = track_df["is_explicit"].mean()
 
     # Album format distribution
-    album_distribution = track_df["album_type"].value_counts(normalize=True)
+    # Only album types present in the selection, not every category
+    album_types = track_df["album_type"].cat.remove_unused_categories()
+    album_distribution = album_types.value_counts(normalize=True)
 
     # Content variety
-    content_variety_index = track_df["song"].nunique() / total_tracks
+    song_codes = track_df["song"].cat.codes.to_numpy()
+    content_variety_index = np.unique(song_codes).size / total_tracks
 
     kpis = {
         "ACI": artist_concentration_index,
@@ -118,10 +159,19 @@ def add_duration_features(df):
 
     df["duration_minutes"] = df["duration_ms"] / 60000
 
-    df["duration_bucket"] = pd.cut(
-        df["duration_minutes"],
-        bins=[0, 2, 3, 4, 10],
-        labels=["Short", "Medium", "Long", "Very Long"]
+    # Right-closed bins, matching pd.cut; values outside (0, 10] stay missing
+    bins = np.array([0, 2, 3, 4, 10])
+    labels = ["Short", "Medium", "Long", "Very Long"]
+
+    minutes = df["duration_minutes"].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    codes = np.searchsorted(bins, minutes, side="left") - 1
+    codes[codes >= len(labels)] = -1
+
+    df["duration_bucket"] = pd.Categorical.from_codes(
+        codes,
+        categories=labels,
+        ordered=True
     )
 
     return df
@@ -136,10 +186,10 @@ def create_rank_groups(df):
     Groups tracks by ranking segments
     """
 
-    def rank_category(rank):
-        return "Top 10" if rank <= 10 else "Top 50"
-
-    df["rank_group"] = df["position"].apply(rank_category)
+    df["rank_group"] = pd.Categorical(
+        np.where(df["position"].to_numpy() <= 10, "Top 10", "Top 50"),
+        categories=["Top 10", "Top 50"]
+    )
 
     return df
 
@@ -148,17 +198,32 @@ def create_rank_groups(df):
 # COLLABORATION NETWORK CREATION
 # ======================================================
 
+def map_collaboration_edges(df):
+    """
+    Maps each distinct artist combination to its collaboration edges
+    """
+
+    # Each chart day repeats the same collaborations, so enumerate
+    # pairs once per distinct artist combination
+    unique_rows = df.loc[~df["artist_clean"].duplicated()]
+
+    groups = zip(unique_rows["artist_clean"], unique_rows["artist_list"])
+
+    return {
+        artist_clean: list(combinations(artists, 2))
+        for artist_clean, artists in groups
+        if isinstance(artists, list) and len(artists) > 1
+    }
+
+
 def build_artist_collaboration_network(df):
     """
     Builds network graph of artist collaborations
     """
 
-    graph = nx.Graph()
+    edges = chain.from_iterable(map_collaboration_edges(df).values())
 
-    for artists in df["artist_list"]:
-        if isinstance(artists, list) and len(artists) > 1:
-            for i in range(len(artists)):
-                for j in range(i + 1, len(artists)):
-                    graph.add_edge(artists[i], artists[j])
+    graph = nx.Graph()
+    graph.add_edges_from(edges)
 
     return graph
@@ -1,6 +1,8 @@
 import streamlit as st
-import pandas as pd
+import numpy as np
 import plotly.express as px
+import networkx as nx
+from itertools import chain
 from pyvis.network import Network
 import streamlit.components.v1 as components
 
@@ -53,16 +55,23 @@ def load_full_pipeline():
     df = load_data("data/Atlantic_United_Kingdom.csv")
     df = normalize_artist_names(df)
 
+    # Positional track id, carried into the exploded artist table
+    df["_tid"] = np.arange(len(df), dtype=np.int32)
+
     artist_level_df = create_artist_level_table(df)
 
+    # Full collaboration graph, filtered later through subgraph views
+    collaboration_edges = map_collaboration_edges(df)
+    network_full = nx.Graph(chain.from_iterable(collaboration_edges.values()))
+
     df = add_duration_features(df)
     df = create_rank_groups(df)
 
-    return df, artist_level_df
+    return df, artist_level_df, network_full, collaboration_edges
 
 
 with st.spinner("Loading UK Market Structure Analysis....."):
-    track_data, artist_data = load_full_pipeline()
+    track_data, artist_data, network_full, collaboration_edges = load_full_pipeline()
 
 
 # ======================================================
@@ -94,32 +103,53 @@ track_type_filter = st.sidebar.selectbox(
 
 
 # ======================================================
-# APPLY FILTERS
+# APPLY FILTERS & KPI COMPUTATION (CACHED PER FILTER COMBINATION)
 # ======================================================
 
-filtered_data = track_data[
-    (track_data["date"] >= pd.to_datetime(date_range[0])) &
-    (track_data["date"] <= pd.to_datetime(date_range[1])) &
-    (track_data["album_type"].isin(album_filter))
-]
+@st.cache_data
+def compute_view(date_lo, date_hi, album_tuple, artist_tuple, track_type):
 
-if artist_filter:
-    filtered_data = filtered_data[filtered_data["artist"].isin(artist_filter)]
+    # Build one boolean mask and index the frame once
+    dates = track_data["date"].to_numpy()
 
-if track_type_filter == "Solo Only":
-    filtered_data = filtered_data[~filtered_data["artist"].str.contains("&")]
+    mask = (dates >= np.datetime64(date_lo)) & (dates <= np.datetime64(date_hi))
+    mask &= track_data["album_type"].isin(album_tuple).to_numpy()
 
-elif track_type_filter == "Collaborations Only":
-    filtered_data = filtered_data[filtered_data["artist"].str.contains("&")]
+    if artist_tuple:
+        mask &= track_data["artist"].isin(artist_tuple).to_numpy()
 
-filtered_artist_data = create_artist_level_table(filtered_data)
+    if track_type == "Solo Only":
+        mask &= ~track_data["is_collab"].to_numpy()
 
+    elif track_type == "Collaborations Only":
+        mask &= track_data["is_collab"].to_numpy()
 
-# ======================================================
-# KPI COMPUTATION
-# ======================================================
+    filtered = track_data[mask]
+
+    # Reuse the pre-exploded artist table: _tid indexes straight into mask
+    filtered_artist = artist_data[mask[artist_data["_tid"].to_numpy()]]
+
+    kpis, artist_frequency = calculate_market_kpis(filtered, filtered_artist)
+
+    # Only edges from collaborations present in the filter, so artists that
+    # collaborated outside the selection are not linked
+    active_edges = chain.from_iterable(
+        collaboration_edges.get(artist_clean, ())
+        for artist_clean in filtered["artist_clean"].unique()
+    )
+
+    network_edges = list(network_full.edge_subgraph(active_edges).edges)
 
-kpis, artist_frequency = calculate_market_kpis(filtered_data, filtered_artist_data)
+    return filtered, filtered_artist, kpis, artist_frequency, network_edges
+
+
+filtered_data, filtered_artist_data, kpis, artist_frequency, network_edges = compute_view(
+    date_range[0],
+    date_range[1],
+    tuple(sorted(album_filter)),
+    tuple(sorted(artist_filter)),
+    track_type_filter
+)
 
 
 # ======================================================
@@ -186,9 +216,12 @@ st.markdown("""
 
 st.subheader("Explicit Content Performance")
 
+explicit_counts = filtered_data["is_explicit"].value_counts().reset_index()
+
 explicit_pie = px.pie(
-    filtered_data,
+    explicit_counts,
     names="is_explicit",
+    values="count",
     title="Explicit vs Clean Content Share"
 )
 
@@ -196,7 +229,7 @@ st.plotly_chart(explicit_pie, width="stretch")
 
 
 explicit_rank_box = px.box(
-    filtered_data,
+    filtered_data[["is_explicit", "position"]],
     x="is_explicit",
     y="position",
     title="Chart Rank Distribution by Content Type"
@@ -218,7 +251,7 @@ st.markdown("""
 st.subheader("Release Format Strategy")
 
 album_chart = px.bar(
-    filtered_data["album_type"].value_counts(),
+    filtered_data["album_type"].cat.remove_unused_categories().value_counts(),
     title="Single vs Album Presence"
 )
 
@@ -226,7 +259,7 @@ st.plotly_chart(album_chart, width="stretch")
 
 
 album_size_scatter = px.scatter(
-    filtered_data,
+    filtered_data[["total_tracks", "position"]],
     x="total_tracks",
     y="position",
     title="Album Size vs Chart Position"
@@ -248,7 +281,7 @@ st.markdown("""
 st.subheader("Track Duration Patterns")
 
 duration_hist = px.histogram(
-    filtered_data,
+    filtered_data[["duration_bucket"]],
     x="duration_bucket",
     title="Track Duration Distribution"
 )
@@ -257,7 +290,7 @@ st.plotly_chart(duration_hist, width="stretch")
 
 
 duration_popularity = px.scatter(
-    filtered_data,
+    filtered_data[["duration_minutes", "popularity"]],
     x="duration_minutes",
     y="popularity",
     title="Track Duration vs Popularity"
@@ -278,16 +311,24 @@ st.markdown("""
 
 st.subheader("Artist Collaboration Network")
 
-network_graph = build_artist_collaboration_network(filtered_data)
+@st.cache_data
+def render_network_html(edges_tuple):
 
-if len(network_graph.nodes) > 0:
+    network_graph = nx.Graph()
+    network_graph.add_edges_from(edges_tuple)
 
     network = Network(height="500px", bgcolor="#0E1117", font_color="white")
     network.from_nx(network_graph)
-    network.save_graph("network.html")
 
-    html_file = open("network.html", "r", encoding="utf-8")
-    components.html(html_file.read(), height=550)
+    return network.generate_html()
+
+
+if network_edges:
+
+    # Sorted edge tuple: identical networks share one cached render
+    edges_tuple = tuple(sorted(map(tuple, network_edges)))
+
+    components.html(render_network_html(edges_tuple), height=550)
 
 else:
     st.info("No collaborations available for selected filters.")